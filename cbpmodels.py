@@ -3,21 +3,96 @@
 Classes for creating and saving simple Scatter or Regression plots from cerebellum morphology data.
 """
 
+import os
+import re
+import sys
 import shutil
+import hashlib
 import logging
+import weakref
 import warnings
 from pathlib import Path
-from itertools import combinations
+from itertools import combinations, count
 from datetime import datetime
-from functools import wraps
+from functools import wraps, lru_cache
+from concurrent.futures import ProcessPoolExecutor
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import matplotlib.ticker as tk
+import matplotlib
+
+# batch-saving scripts can opt in to the non-interactive Agg backend, which skips GUI canvas and event-loop setup.
+# must be selected before pyplot is imported. pyplot itself is only imported by methods which open or draw on
+# pyplot-managed figures, so headless saving (including worker processes) never pays for it.
+HEADLESS = os.environ.get('CEREBELLUM_HEADLESS') == '1'
+if HEADLESS:
+    matplotlib.use('Agg')
+
 from matplotlib.lines import Line2D
+from matplotlib.quiver import Quiver
+from matplotlib.figure import Figure
+from matplotlib.transforms import ScaledTranslation
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 
 logger = logging.getLogger('cbpmodels.py')
+# (pool, dataframe, rcParams) of the worker processes for parallel saving, created by `_save_pool()` on first use.
+_SAVE_POOL = None
+
+def load_data(csv_path: str) -> pd.DataFrame:
+    """Read cerebellum morphology data from a .csv file. The parsed dataframe is pickled alongside the .csv, and
+    read from the pickle on subsequent calls until either the .csv or this module changes.
+
+    Args:
+        csv_path (str): path to the .csv file, e.g. 'all_species_values.csv'.
+
+    Returns:
+        data (pd.DataFrame): dataframe of morphology data, excluding the 'Source' column.
+    """
+    csv_path = Path(csv_path)
+    cache_path = csv_path.with_suffix('.pkl')
+    # the cache is stamped with the modification time and size of its sources, and only used on an exact match, so
+    # that a replaced .csv is picked up even when it carries an older modification time (e.g. unzipped or rsync'd).
+    source_stamp = tuple((path.stat().st_mtime_ns, path.stat().st_size) for path in (csv_path, Path(__file__)))
+
+    # unpickling can run arbitrary code, so the only cache read is the one this function writes beside the .csv it
+    # was parsed from; it is as trusted as the data directory itself. a cache that cannot be read (truncated, or
+    # written by another pandas version) is ignored and rebuilt from the .csv.
+    if cache_path.exists():
+        try:
+            cached_stamp, cached_data = pd.read_pickle(cache_path)
+        except Exception:
+            logger.debug(f'\nCould not read data cache {cache_path}; parsing {csv_path} instead.')
+        else:
+            if cached_stamp == source_stamp:
+                return cached_data
+
+    # 'Source' is never plotted, so is skipped at parse time; explicit dtypes avoid type inference. name columns are
+    # categorical, so that filtering by species or family compares integer codes rather than strings. measurements
+    # are only plotted, so single precision is ample and halves the memory touched by log/groupby/min/max passes.
+    data = pd.read_csv(
+        csv_path,
+        usecols=lambda col: col != 'Source',
+        dtype={
+            'Species': 'category',
+            'Cerebellum Surface Area': 'float32',
+            'Cerebrum Surface Area': 'float32',
+            'Cerebellum Volume': 'float32',
+            'Cerebrum Volume': 'float32',
+            'Family': 'category'
+            }
+        )
+
+    # written under a temporary name then renamed, so that processes importing the module at the same time (e.g.
+    # parallel save workers) never read a partial cache.
+    tmp_path = cache_path.with_name(f'{cache_path.name}.{os.getpid()}.tmp')
+    try:
+        pd.to_pickle((source_stamp, data), tmp_path)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        logger.debug(f'\nCould not write data cache to {cache_path}; the .csv will be parsed on every import.')
+
+    return data
 
 class Scatter(object):
     """Class for creating fully-constructed scatter plots with matplotlib.pyplot, intended for use within the
@@ -26,16 +101,25 @@ class Scatter(object):
     multitudinal plots to their respective 'Logged' or 'Simple' save folders, each containing save-details text files.
 
     Attributes:
-        DATA: default dataframe. Ensure dataframe contains a 'Family' column.
+        DATA: default dataframe. Ensure dataframe contains a 'Family' column. Data derived from it (the logged copy,
+            name lookup and column checks) is cached per dataframe object, so replace DATA rather than editing it in
+            place; after an in-place edit, reassign a copy (`Scatter.DATA = Scatter.DATA.copy()`).
         ORIGINAL_COLORS: default species:color map {'Hominidae': '#7f48b5', 'Hylobatidae': '#c195ed',
             'Cercopithecidae': '#f0bb3e', 'Platyrrhini': '#f2e3bd'}.
+        DEFAULT_FIGSIZES: default figure width, height for each number of plots up to 3.
         new_def_colors: user-updated default species:color map. Defaults to copy of ORIGINAL_COLORS.
+        _FOLDER_NAMES: save folder name for simple (False) and log (True) plots.
+        _SAVE_LABELS: save confirmation label for each (default pairs, logged) combination.
         def_pairs: Default list of column indices from which to make pairwise combinations with Scatter.xy_pairs.
             Used when no arguments are passed to property `xy`, or variables cannot be plotted/combined with those
             arguments.
-        __instances: list of class instances, for use when displaying or saving all instances.
+        __instances: weak mapping of creation number to class instance, for use when displaying or saving all
+            instances. instances which are no longer referenced elsewhere are dropped.
+        _logged_cache: (source dataframe, log-transformed copy) pair reused by logged plots.
+        _rank_cache: (source dataframe, name lookup) pair reused when emphasizing a species or family.
+        _numeric_cache: (source dataframe, numeric column mask) pair reused when validating column indices.
     """
-    DATA = pd.read_csv('all_species_values.csv')
+    DATA = load_data('all_species_values.csv')
 
     ORIGINAL_COLORS = {
                 'Hominidae': '#7f48b5',
@@ -44,8 +128,19 @@ class Scatter(object):
                 'Platyrrhini': '#f2e3bd'
                 } 
     new_def_colors = ORIGINAL_COLORS.copy()
+    # default width, height of figures containing 1-3 plots; larger figures are (13.5, 8).
+    DEFAULT_FIGSIZES = {1: (4.5, 4), 2: (9, 4), 3: (13.5, 4)}
+    _FOLDER_NAMES = {False: 'Saved Simple Plots', True: 'Saved Log Plots'}
+    _SAVE_LABELS = {
+        (False, False): 'Simple', (False, True): 'Log',
+        (True, False): 'Default Simple', (True, True): 'Default Log'
+        }
     def_pairs = 4, 3, 1
-    __instances = []
+    __instances = weakref.WeakValueDictionary()
+    __instance_ids = count()
+    _logged_cache = None, None
+    _rank_cache = None, None
+    _numeric_cache = None, None
     
     def __init__(self, xy=None, colors=None, logged=False, *, figsize=None, grid=None, edgecolor='k', marker='o', 
                 title=None, legend_loc='upper left', species_means=False, family_means=False, overlay_means=False):
@@ -84,7 +179,15 @@ class Scatter(object):
 
         self.emph_arg = None       
         self.emph_kwargs = None
-        Scatter.__instances.append(self)
+        Scatter.__instances[next(Scatter.__instance_ids)] = self
+
+    def __getstate__(self) -> dict:
+        """Instance state for pickling, e.g. when sent to worker processes by `Scatter.save_plots(parallel=True)`.
+        Plotted data is left out, as it is rebuilt from Scatter.DATA each time the instance is plotted.
+        """
+        state = self.__dict__.copy()
+        state.pop('data', None)
+        return state
     
     @property
     def xy(self) -> tuple[tuple[str, str], ...]:
@@ -137,9 +240,10 @@ class Scatter(object):
         if new_colors is None:
             colors = Scatter.new_def_colors
         else:
-            colors = Scatter.new_def_colors.copy()
-            if new_colors.keys() <= colors.keys():
-                colors.update(new_colors)
+            # custom colors are merged into a snapshot of the current defaults, so later set_def_colors() calls do
+            # not change this instance's colors.
+            if new_colors.keys() <= Scatter.new_def_colors.keys():
+                colors = {**Scatter.new_def_colors, **new_colors}
             else:
                 raise ValueError(
                     'Invalid taxonomic family-keys were passed to set_def_colors(). See all_species_values.csv'
@@ -165,14 +269,7 @@ class Scatter(object):
     @figsize.setter
     def figsize(self, width_height):
         if width_height is None:
-            fig_height = 4
-            if len(self.xy) <= 3:
-                fig_width = len(self.xy) * 4.5
-            else:
-                fig_width = 13.5
-                fig_height = 8
-
-            figsize = fig_width, fig_height
+            figsize = Scatter.DEFAULT_FIGSIZES.get(len(self.xy), (13.5, 8))
         else:
             if any(size <= 0 for size in width_height):
                 raise ValueError('Attribute `figsize` must contain only positive integers.')
@@ -203,7 +300,8 @@ class Scatter(object):
             if len(self.xy) <= 3:
                 rows_cols = 1, len(self.xy)
             else:
-                rows_cols = 2, np.ceil(len(self.xy) / 2)
+                # ceiling division, keeping the column count an int.
+                rows_cols = 2, -(-len(self.xy) // 2)
 
         n_axes = rows_cols[0] * rows_cols[1]
         if n_axes < len(self.xy):
@@ -212,7 +310,7 @@ class Scatter(object):
                 f' plots; axes for {len(self.xy)} plot(s) required. Grid dimensions should be positive integers.'
                 )
 
-        self._grid = int(float(rows_cols[0])), int(float(rows_cols[1]))
+        self._grid = int(rows_cols[0]), int(rows_cols[1])
 
     @staticmethod
     def xy_pairs(cols: list[int]) -> tuple[tuple[str, str], ...]:
@@ -231,42 +329,31 @@ class Scatter(object):
             pairwise combinations). 
         """
         try:
-            cols = [int(str(col_idx)) for col_idx in cols]
+            cols = tuple(int(str(col_idx)) for col_idx in cols)
         except ValueError:
             logger.debug(f'\nValueError: non-int was passed to cols: {cols}')
             raise ValueError('xy_pairs() does not accept floating-point or alpha character values.\n') from None
 
-        invalid_cols = []    
-        for col_idx in cols:
-            if (
-                col_idx >= len(Scatter.DATA.columns)
-                or Scatter.DATA[Scatter.DATA.columns[col_idx]].dtype != ('float64' or 'int64')
-            ):
-                invalid_cols.append(col_idx)
-
-        valid_cols = [col_idx for col_idx in cols if col_idx not in invalid_cols]
-
-        try:
-            if len(valid_cols) >= 2:
-                if invalid_cols:
-                    warnings.warn(
-                        f'The following invalid indices were passed to attribute `xy`: {list(set(invalid_cols))}.'
-                        f' Combinations were therefore made from the following indices only: {list(set(valid_cols))}.'
-                        )
-   
-                if len(set(valid_cols)) != len(valid_cols):
-                    dupes = list(set([x for x in valid_cols if valid_cols.count(x) > 1]))
-                    warnings.warn(
-                        f'Duplicates of the following valid column indices were ignored to avoid plotting them'
-                        f' against one another: {dupes}.\n'
-                        )
-
-                # dict.fromkeys retains order of col indices.
-                xy_pairs = tuple(combinations(Scatter.DATA.columns[list(dict.fromkeys(valid_cols))], 2))
-            else:
-                raise ValueError
+        # pairs are memoized per `cols` for the current Scatter.DATA; fetching the numeric mask clears them first if
+        # the dataframe has been replaced. the cached helper only reports invalid and duplicate indices, so they are
+        # warned about on every call here.
+        Scatter._numeric_mask()
+        xy_pairs, valid_cols, invalid_cols, dupes = Scatter._xy_pairs(cols)
+
+        if len(valid_cols) >= 2:
+            if invalid_cols:
+                warnings.warn(
+                    f'The following invalid indices were passed to attribute `xy`: {list(set(invalid_cols))}.'
+                    f' Combinations were therefore made from the following indices only:'
+                    f' {list(dict.fromkeys(valid_cols))}.'
+                    )
 
-        except ValueError:
+            if dupes:
+                warnings.warn(
+                    f'Duplicates of the following valid column indices were ignored to avoid plotting them'
+                    f' against one another: {list(dupes)}.\n'
+                    )
+        else:
             print(
                 f'\nNo valid combinations could be made from the list passed to attribute `xy`. '
                 f'{"The only valid index was: " + ("".join(str(c) for c in valid_cols)) + "." if valid_cols else ""}'
@@ -274,10 +361,63 @@ class Scatter(object):
                 f'Please ensure the list has at least 2 valid indices, where such indices refer to columns'
                 f' containing floating-point numbers or integers.\n'
                 )
-            xy_pairs = tuple(combinations(Scatter.DATA.columns[list(dict.fromkeys(Scatter.def_pairs))], 2))
-        
+
         return xy_pairs
 
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _xy_pairs(cols: tuple[int, ...]) -> tuple[tuple, tuple[int, ...], tuple[int, ...], tuple]:
+        """Memoized, side-effect free body of `Scatter.xy_pairs()`, for a tuple of integer column indices. Returns
+        the pairs to plot along with the valid, invalid and duplicated indices of `cols`, which `xy_pairs()` reports.
+        The cache is cleared when Scatter.DATA is replaced, and when default pairs are changed, as they are plotted in
+        place of invalid `cols`.
+        """
+        # a column index is valid if it is in range and its column is numeric; checked for all of `cols` at once
+        # against the numeric column mask.
+        is_numeric = Scatter._numeric_mask()
+        cols_arr = np.asarray(cols, dtype=int)
+        in_range = cols_arr < len(is_numeric)
+        valid_mask = in_range & is_numeric[np.where(in_range, cols_arr, 0)]
+
+        invalid_cols = tuple(cols_arr[~valid_mask].tolist())
+        valid_cols = tuple(cols_arr[valid_mask].tolist())
+
+        # valid indices are counted in insertion order so that duplicates can be reported and dropped.
+        valid_counts = {}
+        for col_idx in valid_cols:
+            valid_counts[col_idx] = valid_counts.get(col_idx, 0) + 1
+        dupes = tuple(col_idx for col_idx, occurrences in valid_counts.items() if occurrences > 1)
+
+        if len(valid_cols) >= 2:
+            # dict keys retain order of col indices.
+            xy_pairs = Scatter._pair_combinations(tuple(Scatter.DATA.columns.values[list(valid_counts)]))
+        else:
+            def_cols = list(dict.fromkeys(Scatter.def_pairs))
+            xy_pairs = Scatter._pair_combinations(tuple(Scatter.DATA.columns.values[def_cols]))
+
+        return xy_pairs, valid_cols, invalid_cols, dupes
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _pair_combinations(col_names: tuple[str, ...]) -> tuple[tuple[str, str], ...]:
+        """Returns the pairwise combinations of deduplicated column names `col_names`, so that `cols` lists which
+        differ only by invalid or repeated indices share one tuple of pairs.
+        """
+        return tuple(combinations(col_names, 2))
+
+    @staticmethod
+    def _numeric_mask() -> np.ndarray:
+        """Returns a boolean array which is True at the index of each numeric column of Scatter.DATA. Computed once
+        per dataframe object, until Scatter.DATA is replaced, which also clears the memoized xy pairs.
+        """
+        source, is_numeric = Scatter._numeric_cache
+        if source is not Scatter.DATA:
+            is_numeric = np.array([pd.api.types.is_numeric_dtype(dtype) for dtype in Scatter.DATA.dtypes], dtype=bool)
+            Scatter._numeric_cache = Scatter.DATA, is_numeric
+            Scatter._xy_pairs.cache_clear()
+
+        return is_numeric
+
     def emphasize(self, species_or_fam_name, **kwargs):
         """highlights the data points exclusive to `species_or_fam_name`, by reducing the alpha value of all other 
         points to `alpha_value`, increasing marker size to `s`, and increasing line width to `linewidth`.
@@ -305,22 +445,26 @@ class Scatter(object):
     def add_emphasis(func):
         @wraps(func)
         def wrapper(self, species_or_fam_name, with_highlight=True, color=None, edgecolor=None,
-            alpha=0.2, s=None, linewidth=1.5, with_arrows=False, scientific_name=True, legend=True):
+            alpha=0.2, s=None, linewidth=1.5, with_arrows=False, scientific_name=True, legend=True, **kwargs):
             
-            # get the rank column name (Species or Family) for the name passed to `species_or_fam_name`.
-            # e.g. rank_col = 'Species' when `species_or_fam_name` == 'Homo_sapiens'.
-            rank_col = ''.join(Scatter.DATA.columns[(Scatter.DATA == species_or_fam_name).any()])
+            # get the rank column name (Species or Family) and family for the name passed to `species_or_fam_name`.
+            # e.g. rank_col, family_name = 'Species', 'Hominidae' when `species_or_fam_name` == 'Homo_sapiens'.
+            try:
+                rank_col, family_name = Scatter._rank_lookup()[species_or_fam_name]
+            except KeyError:
+                raise ValueError(
+                    f'{species_or_fam_name!r} is not a Species or Family name in Scatter.DATA.'
+                    ) from None
 
             if color is None:
-                family_name = Scatter.DATA.loc[Scatter.DATA[rank_col] == species_or_fam_name, 'Family'].values[0]
                 color = self.colors[family_name]
 
             if edgecolor is None:
                 edgecolor = self.edgecolor
 
-            # ensures Family legend markers are updated. 
+            # ensures Family legend markers are updated, without writing into the shared default color map.
             if rank_col == 'Family':
-                self.colors.update({species_or_fam_name: color})
+                self.colors = {**self.colors, species_or_fam_name: color}
 
             if not with_highlight:
                 alpha = 1
@@ -329,57 +473,76 @@ class Scatter(object):
                 self,
                 emph_family=species_or_fam_name, 
                 emph_edgecol=edgecolor, emph_edgewidth=linewidth,
-                alpha=alpha
+                alpha=alpha, **kwargs
                 )
 
-            # filter for `species_or_fam_name` values only. 
-            name_filt = self.data[rank_col] == species_or_fam_name
+            # row positions of `species_or_fam_name` values only, and the plotted columns as arrays, so that each
+            # axes indexes NumPy arrays rather than going through pandas .loc.
+            name_filt = Scatter._category_masks(self.data, rank_col, [species_or_fam_name])[species_or_fam_name]
+            name_idx = np.flatnonzero(name_filt)
+            col_arrays = {var: self.data[var].to_numpy() for pair in self.xy for var in pair}
+
+            # the species legend is the same on every axes, so its handles are built once.
+            if legend and rank_col != 'Family':
+                if scientific_name: 
+                    legend_label = species_or_fam_name[0] + '. ' + species_or_fam_name.split('_')[1]
+                else:
+                    legend_label = species_or_fam_name.replace('_', ' ')
+
+                handles = [
+                    Line2D([0], [0],
+                    color='w', marker=self.marker, markerfacecolor=color,
+                    markeredgecolor=edgecolor, markersize=4,
+                    label=legend_label
+                    )]
+
+            # arrow geometry is the same on every axes: tails sit 25pt right and 20pt below each point, and heads
+            # stop 5pt short of it. arrow vectors are in inches.
+            if with_arrows:
+                tail_offset = ScaledTranslation(25 / 72, -20 / 72, fig.dpi_scale_trans)
+                arrow_scale = (np.hypot(25, 20) - 5) / np.hypot(25, 20) / 72
+                arrow_uv = -25 * arrow_scale, 20 * arrow_scale
             
             for ax_n, (x, y) in enumerate(self.xy):
                 # get data-points which correspond to `species_or_fam_name` value.
-                species_x = self.data.loc[name_filt, x]
-                species_y = self.data.loc[name_filt, y]
+                species_x = col_arrays[x][name_idx]
+                species_y = col_arrays[y][name_idx]
                 
                 axs[ax_n].scatter(
                     species_x, species_y,
                     facecolors=color, edgecolors=edgecolor, marker=self.marker,
                     s=s, linewidth=linewidth, alpha=0.85
                     )
-                    
-                if legend and rank_col != 'Family':
-                    if scientific_name: 
-                        legend_label = species_or_fam_name[0] + '. ' + species_or_fam_name.split('_')[1]
-                    else:
-                        legend_label = species_or_fam_name.replace('_', ' ')
-
-                    handles = [
-                        Line2D([0], [0],
-                        color='w', marker=self.marker, markerfacecolor=color,
-                        markeredgecolor=edgecolor, markersize=4,
-                        label=legend_label
-                        )]
-
-                    for xy_pair in zip(species_x, species_y):
-                        if not any(np.isnan(element) for element in xy_pair):
-                            emph_leg = axs[ax_n].legend(loc=(0.02, 0.55), handles=handles, handletextpad=0.1)
-                            emph_leg.get_frame().set_color('white')
+
+                # only add the legend to axes where at least one emphasized point could be plotted.
+                if legend and rank_col != 'Family' and not (np.isnan(species_x) | np.isnan(species_y)).all():
+                    emph_leg = axs[ax_n].legend(loc=(0.02, 0.55), handles=handles, handletextpad=0.1)
+                    emph_leg.get_frame().set_color('white')
                             
                 if with_arrows:
-                    for x, y in zip(species_x, species_y):
-                        axs[ax_n].annotate(          
-                            "", xy=(x, y), xytext=(25, -20),
-                            arrowprops=dict(arrowstyle="->", shrinkB=5), textcoords='offset points')
+                    # one quiver draws every arrow as a single collection. like annotations, arrows do not extend
+                    # the axis limits.
+                    arrows = Quiver(
+                        axs[ax_n], species_x, species_y, *arrow_uv,
+                        angles='uv', units='inches', scale_units='inches', scale=1,
+                        width=1 / 72, headwidth=4, headlength=4, headaxislength=3.5,
+                        transform=axs[ax_n].transData + tail_offset, clip_on=False
+                        )
+                    arrows.set_in_layout(False)
+                    axs[ax_n].add_collection(arrows, autolim=False)
 
             return fig
         wrapper.unemphasized = func
         return wrapper
 
     @add_emphasis
-    def plot(self, emph_family=None, emph_edgecol=None, emph_edgewidth=0.5, **kwargs):
+    def plot(self, emph_family=None, emph_edgecol=None, emph_edgewidth=0.5, headless=False, **kwargs):
         """Plots variables on figure axes with color map, legend, handles matching data-point colors,
         and custom labelling depending on instance variable `logged`.
 
         Args:
+            headless (bool, optional): if True, draw on a standalone Agg-backed figure which is not registered with
+                pyplot, for figures that are only saved. Defaults to False.
             **kwargs: additional matplotlib.axes.Axes.scatter properties.
 
         Returns:
@@ -387,55 +550,97 @@ class Scatter(object):
                 (each instance passed to save_plots() (and by extension, save()).
             axs (class): array of matplotlib.axes.Axes objects.
         """
-        fig, axs = plt.subplots(*self.grid, figsize=self.figsize, squeeze=False)
+        # constrained layout is solved once at draw time, including room for the suptitle.
+        if headless:
+            # bypasses pyplot's figure manager and the interactive backend's GUI canvas.
+            fig = Figure(figsize=self.figsize, constrained_layout=True)
+            FigureCanvasAgg(fig)
+            axs = fig.subplots(*self.grid, squeeze=False)
+        else:
+            import matplotlib.pyplot as plt
+            fig, axs = plt.subplots(*self.grid, figsize=self.figsize, squeeze=False, constrained_layout=True)
         axs = axs.flatten()
 
-        self.data = Scatter.DATA.copy()
-        
+        # plotting only reads from the data, so Scatter.DATA (or its cached logged copy) is shared rather than copied.
+        self.data = Scatter._logged_data() if self.logged else Scatter.DATA
+
+        mean_data = None
+        if self.species_means or self.family_means:
+            groupby_col = 'Family' if self.family_means else 'Species'
+            col_agg_dict = Scatter._col_agg_dict(self.data, groupby_col)
+
+            grouped_data = self.data.groupby(groupby_col, observed=True).agg(col_agg_dict).reset_index()
+            if self.overlay_means:
+                mean_data = grouped_data
+            else:
+                self.data = grouped_data
+
+        # boolean row-masks for each family, so that every family is drawn as a single-color scatter. uniformly
+        # styled collections are stamped once per marker by the Agg renderer, rather than stroked point-by-point.
+        family_masks = Scatter._category_masks(self.data, 'Family', self.colors)
+        if emph_family is not None:
+            # points drawn by the emphasis layer are left out of the base layer, so that each point is drawn once.
+            emph_rank = Scatter._rank_lookup()[emph_family][0]
+            emph_filt = Scatter._category_masks(self.data, emph_rank, [emph_family])[emph_family]
+            family_masks = {family: mask & ~emph_filt for family, mask in family_masks.items()}
+        if mean_data is not None:
+            mean_masks = Scatter._category_masks(mean_data, 'Family', self.colors)
+
+        # extract each plotted column as an array once, as variables are shared between axes.
+        plot_vars = {var for pair in self.xy for var in pair}
+        col_arrays = {var: self.data[var].to_numpy() for var in plot_vars}
+        if mean_data is not None:
+            mean_arrays = {var: mean_data[var].to_numpy() for var in plot_vars}
+
         if self.logged:
-            for col in self.data.columns:
-                if self.data[col].dtype == 'float64':
-                    self.data[col] = np.log(self.data[col])
-                 
-        for ax_n, (x, y) in enumerate(self.xy):
-            if self.species_means or self.family_means:
-                groupby_col = 'Family' if self.family_means else 'Species'
-
-                col_agg_dict = {}
-                for col in self.data.columns:
-                    if self.data[col].dtype == 'float64':
-                        col_agg_dict[col] = 'mean'
-                    elif col != groupby_col:
-                        col_agg_dict[col] = 'first'
-
-                if not self.overlay_means:
-                    self.data = self.data.groupby(groupby_col).agg(col_agg_dict).reset_index()
-
-            axs[ax_n].scatter(
-                self.data[x], self.data[y],
-                c=self.data.Family.map(self.colors),
-                edgecolor=self.edgecolor, marker=self.marker, **kwargs
-                )
+            # ticks for each variable are computed once, and reused by every axes plotting that variable.
+            # values greater than 0 taken due to weird behavior when plots are not emphasised.
+            # bounds come from the already-extracted column arrays, skipping NaNs as DataFrame.agg would.
+            log_ticks = {}
+            for var in plot_vars:
+                ticks = np.arange(np.floor(np.nanmin(col_arrays[var])), np.ceil(np.nanmax(col_arrays[var])), 0.5)
+                log_ticks[var] = ticks[ticks >= -0.5]
+
+        # handles for main legend, shared by every axes. legend reflects emphasization of family.
+        handles = [
+            Line2D([0], [0],
+            color='w', marker=self.marker, markerfacecolor=color,
+            markeredgecolor=emph_edgecol if family == emph_family else self.edgecolor,
+            markeredgewidth=emph_edgewidth if family == emph_family else 0.5,
+            markersize=4, label=family
+            ) for family, color in self.colors.items()
+            ]
+
+        # title and axis labels of each axes.
+        log_prefix = 'Log ' if self.logged else ''
+        ax_labels = [
+            dict(
+                title=f'{"Logged " if self.logged else ""}Primate {x} against\n{y}',
+                xlabel=f'{log_prefix}{x}',
+                ylabel=f'{log_prefix}{y}'
+                ) for x, y in self.xy
+            ]
 
-            if self.overlay_means_means:
-                mean_data = self.data.groupby(groupby_col).agg(col_agg_dict).reset_index()
+        for ax_n, (x, y) in enumerate(self.xy):
+            for family, color in self.colors.items():
+                mask = family_masks[family]
+                if mask.any():
+                    axs[ax_n].scatter(
+                        col_arrays[x][mask], col_arrays[y][mask],
+                        c=color,
+                        edgecolor=self.edgecolor, marker=self.marker, **kwargs
+                        )
 
-                # average points for each family/species drawn on top of main plot. 
-                axs[ax_n].scatter(
-                    mean_data[x], mean_data[y],
-                    c=mean_data.Family.map(self.colors),
-                    edgecolor='mediumblue', marker='s', linewidth=2, s=35, **kwargs
-                    )
- 
-            # handles for main legend. legend reflects emphasization of family. 
-            handles = [
-                Line2D([0], [0],
-                color='w', marker=self.marker, markerfacecolor=color,
-                markeredgecolor=emph_edgecol if family == emph_family else self.edgecolor,
-                markeredgewidth=emph_edgewidth if family == emph_family else 0.5,
-                markersize=4, label=family
-                ) for family, color in self.colors.items()
-                ]
+            if mean_data is not None:
+                # average points for each family/species drawn on top of main plot.
+                for family, color in self.colors.items():
+                    mask = mean_masks[family]
+                    if mask.any():
+                        axs[ax_n].scatter(
+                            mean_arrays[x][mask], mean_arrays[y][mask],
+                            c=color,
+                            edgecolor='mediumblue', marker='s', linewidth=2, s=35, **kwargs
+                            )
 
             ax_legend = axs[ax_n].legend(
                 title='Family',
@@ -446,53 +651,176 @@ class Scatter(object):
             ax_legend = axs[ax_n].add_artist(ax_legend)
             ax_legend.get_frame().set_color('white')
 
-            axs[ax_n].set(
-                    title=f'{"Logged " if self.logged else ""}Primate {self.xy[ax_n][0]} against\n{self.xy[ax_n][1]}',
-                    xlabel=f'{"Log " if self.logged else ""}{self.xy[ax_n][0]}',
-                    ylabel=f'{"Log " if self.logged else ""}{self.xy[ax_n][1]}'
-                    )
+            axs[ax_n].set(**ax_labels[ax_n])
         
             if self.logged:
-                for var in (x, y):
-                    # values greater than 0 taken due to weird behavior when plots are not emphasised.
-                    ticks = [tick for tick in np.arange(
-                        np.floor(min(self.data[var].dropna())),
-                        np.ceil(max(self.data[var].dropna())),
-                        0.5) if tick >= -0.5]
-
-                    if var == x:
-                        axs[ax_n].set_xticks(ticks)
-                    else:
-                        axs[ax_n].set_yticks(ticks)
-
-        fig.tight_layout(pad=0.4, w_pad=0.5, h_pad=1.0)
+                axs[ax_n].set_xticks(log_ticks[x])
+                axs[ax_n].set_yticks(log_ticks[y])
 
         if self.title:
-            plt.suptitle(self.title, size=16, weight='semibold', x=0.52)
-            if self.grid[0] == 1:
-                fig.subplots_adjust(top=0.8)
-            else:
-                fig.subplots_adjust(top=0.88)
+            fig.suptitle(self.title, size=16, weight='semibold', x=0.52)
 
         return fig, axs
 
-    def display(self, **kwargs) -> None:
-        """Plot and output cbpmodels.Scatter instance to it's own window.
+    @staticmethod
+    def _col_agg_dict(data: pd.DataFrame, groupby_col: str) -> dict[str, str]:
+        """Returns the groupby aggregation for each column of `data` other than `groupby_col`: 'mean' for float
+        columns, otherwise the first value of each group.
+        """
+        return {
+            col: 'mean' if pd.api.types.is_float_dtype(dtype) else 'first'
+            for col, dtype in data.dtypes.items() if col != groupby_col
+            }
+
+    @staticmethod
+    def _category_masks(data: pd.DataFrame, col: str, names) -> dict[str, np.ndarray]:
+        """Returns a boolean row-mask of `data` for each name in `names`, e.g. each family name in the 'Family'
+        column. Masks are built by comparing the integer codes of the categorical column `col`, rather than comparing
+        name strings row by row.
+        """
+        category_col = data[col].astype('category')
+        codes = category_col.cat.codes.to_numpy()
+        code_of = {name: code for code, name in enumerate(category_col.cat.categories)}
+
+        return {
+            name: codes == code_of[name] if name in code_of else np.zeros(len(codes), dtype=bool)
+            for name in names
+            }
+
+    @staticmethod
+    def _logged_data() -> pd.DataFrame:
+        """Returns a copy of Scatter.DATA with every float column natural-log transformed. The transform is computed
+        once and reused by all logged plots, until Scatter.DATA is replaced; in-place edits of Scatter.DATA are not
+        seen by logged plots until then.
+        """
+        source, logged_data = Scatter._logged_cache
+        if source is not Scatter.DATA:
+            logged_data = Scatter.DATA.copy()
+            # one np.log over the 2-D float block, rather than one Series assignment per column.
+            float_cols = logged_data.select_dtypes(include='floating').columns
+            logged_data[float_cols] = np.log(logged_data[float_cols].to_numpy())
+
+            Scatter._logged_cache = Scatter.DATA, logged_data
+
+        return logged_data
+
+    @staticmethod
+    def _rank_lookup() -> dict[str, tuple[str, str]]:
+        """Returns a dictionary mapping each Species and Family name in Scatter.DATA to its (rank column, family name)
+        pair. The dictionary is built once and reused until Scatter.DATA is replaced.
+        """
+        source, lookup = Scatter._rank_cache
+        if source is not Scatter.DATA:
+            families = Scatter.DATA['Family'].dropna()
+            lookup = {family: ('Family', family) for family in families.unique()}
+            species = Scatter.DATA.loc[families.index, 'Species']
+            lookup.update((name, ('Species', family)) for name, family in zip(species, families))
+
+            Scatter._rank_cache = Scatter.DATA, lookup
+
+        return lookup
+
+    def _render(self, headless=False, **kwargs):
+        """Plot instance, with emphasis if `emphasize()` has been called on it.
 
         Args:
+            headless (bool, optional): if True, plot on a figure which is not managed by pyplot. Defaults to False.
             **kwargs: matplotlib.axes.Axes.scatter properties.
+
+        Returns:
+            fig (class): matplotlib.figure.Figure object.
         """
         if self.emph_arg:
-            Scatter.plot(self, self.emph_arg, **self.emph_kwargs, **kwargs)
-        else:
-            Scatter.plot.__wrapped__(self, **kwargs)
+            return Scatter.plot(self, self.emph_arg, **self.emph_kwargs, headless=headless, **kwargs)
+
+        return Scatter.plot.unemphasized(self, headless=headless, **kwargs)[0]
 
+    def _cache_key(self, compress_level: int) -> str:
+        """Returns a hash of everything which affects the saved figure: the class and every instance setting,
+        Scatter.DATA, the matplotlib version and rcParams (style), this module's source, and the .png compression
+        level.
+        """
+        settings = (
+            type(self).__qualname__, matplotlib.__version__, Path(__file__).stat().st_mtime_ns,
+            sorted(Scatter._rc_params().items()),
+            compress_level, self.xy, sorted(self.colors.items()), self.logged, self.figsize, self.grid,
+            self.edgecolor, self.marker, self.title, self.legend_loc, self.species_means, self.family_means,
+            self.overlay_means, self.emph_arg, sorted((self.emph_kwargs or {}).items())
+            )
+        data_hash = pd.util.hash_pandas_object(Scatter.DATA).to_numpy()
+
+        return hashlib.md5(data_hash.tobytes() + repr(settings).encode()).hexdigest()
+
+    @staticmethod
+    def _rc_params() -> dict:
+        """Returns a copy of the current matplotlib rcParams (style), which determine how saved figures look. The
+        backend is left out: it does not change saved .png files, and resolving an unset backend would import pyplot.
+        """
+        return {key: matplotlib.rcParams[key] for key in matplotlib.rcParams if key != 'backend'}
+
+    def _save_png(self, save_path: Path, compress_level: int) -> None:
+        """Renders the figure from `_render()` on a standalone canvas and saves it as a .png.
+
+        Args:
+            save_path (Path): path of the .png file to be saved.
+            compress_level (int): zlib compression level of the .png file.
+        """
+        fig = self._render(headless=True)
+        # the PNG's 'Software' text chunk is left out of saved files.
+        fig.savefig(
+            save_path, format='png', metadata={'Software': None}, pil_kwargs={'compress_level': compress_level}
+            )
+        # saved figures are never shown. clearing breaks the figure/axes reference cycles, so each figure's
+        # artists are freed straight away rather than lingering until the cyclic garbage collector runs.
+        fig.clear()
+
+    def _cached_save(self, save_path: Path, compress_level: int, cache=False) -> None:
+        """Saves the figure from `_render()` as a .png. With `cache`, saved files are also kept in a '.figure_cache'
+        folder in the current directory, and copied rather than rendered and encoded again when the same figure is
+        saved from the same data again.
+
+        Args:
+            save_path (Path): path of the .png file to be saved.
+            compress_level (int): zlib compression level of the .png file.
+            cache (bool, optional): if True, reuse and keep renders in '.figure_cache'. Defaults to False.
+        """
+        if not cache:
+            self._save_png(save_path, compress_level)
+            return
+
+        cache_path = Path(Path.cwd(), '.figure_cache', f'{self._cache_key(compress_level)}.png')
+        if not cache_path.exists():
+            cache_path.parent.mkdir(exist_ok=True)
+            # written under a temporary name then renamed, so that concurrent saves never copy a partial file.
+            tmp_path = cache_path.with_name(f'{cache_path.stem}.{os.getpid()}.tmp')
+            self._save_png(tmp_path, compress_level)
+            os.replace(tmp_path, cache_path)
+
+        shutil.copyfile(cache_path, save_path)
+
+    def display(self, **kwargs) -> None:
+        """Plot and output cbpmodels.Scatter instance to it's own window. Does nothing in headless mode
+        (CEREBELLUM_HEADLESS=1), where there is no window to show the figure in.
+
+        Args:
+            **kwargs: matplotlib.axes.Axes.scatter properties.
+        """
+        # a pyplot figure rendered headless would never be shown or closed, so none is created.
+        if HEADLESS:
+            logger.debug('\ndisplay() called in headless mode; no figure was rendered.')
+            return
+
+        self._render(**kwargs)
+
+        import matplotlib.pyplot as plt
         plt.show()
 
     @classmethod
     def display_all(cls) -> None:
-        """Plot and simultaneously output all instances of cbpmodels.Scatter to their own windows."""
-        for instance in cls.__instances:
+        """Plot and simultaneously output all instances of cbpmodels.Scatter which are still referenced (e.g. assigned
+        to a variable) to their own windows. Instances that are no longer referenced anywhere are not included.
+        """
+        for instance in list(cls.__instances.values()):
             Scatter.display(instance)
 
     @classmethod
@@ -517,7 +845,8 @@ class Scatter(object):
                     'Scatter.set_def_pairs() received invalid input. Only integers are valid, and so new default pairs'
                     ' were not set.'
                     )
-            
+
+        Scatter._xy_pairs.cache_clear()
         logger.info(f'\nset_def_pairs() called: new default column indices are {cls.def_pairs}.')
 
     @classmethod
@@ -572,6 +901,8 @@ class Scatter(object):
 
     @classmethod
     def describe_data(cls, counts=True, surface_area_boxplot=False, volume_boxplot=False):
+        import matplotlib.pyplot as plt
+
         if counts:
             print(
                 f'The dataframe contains {cls.DATA.Species.nunique()} unique species,'
@@ -593,14 +924,15 @@ class Scatter(object):
             plt.title(f'Distribution of {cols[0]}\nand {cols[1]} Data')
             plt.ylabel('Volume $\mathrm{(cm^3)}$')
 
-        plt.show()
+        if not HEADLESS:
+            plt.show()
 
     def save(self) -> None:
         """Save instance of cbpmodels.Scatter instance using Scatter.save_plots()."""
         Scatter.save_plots(self)
 
     @classmethod
-    def save_plots(cls, *args, every=False) -> None:
+    def save_plots(cls, *args, every=False, parallel=False, compress_level=1, cache=False) -> None:
         """Saves simple/log plots to respective folders.
 
         Each figure's save file is named as such:
@@ -611,14 +943,30 @@ class Scatter(object):
 
         Args:
             *args (cbpmodels.Scatter instance): any number of cbpmodels.Scatter instances.
-            every (bool, optional): if True, save every object of cbpmodels.Scatter. Defaults to False.
+            every (bool, optional): if True, save every object of cbpmodels.Scatter which is still referenced (e.g.
+                assigned to a variable); instances no longer referenced anywhere are not saved. Defaults to False.
+            parallel (bool, optional): if True, render and save figures concurrently in worker processes. Scripts
+                must then call save_plots() under an `if __name__ == '__main__':` guard on Windows and macOS.
+                Defaults to False.
+            compress_level (int, optional): zlib compression level of saved .png files, from 0 (none) to 9 (smallest
+                files). Level 1 encodes several times faster than matplotlib's default of 6, for slightly larger files.
+                Defaults to 1.
+            cache (bool, optional): if True, keep each render in a '.figure_cache' folder in the current directory,
+                and copy it instead of rendering again when an identical figure is saved from identical data and
+                style. The folder is not pruned; delete it to reclaim space. Defaults to False.
         
         Raises:
             TypeError: if no objects are specified when `every` is False, or when objects passed to save_plots() are not
                 an instance of Scatter or Regression.
         """
         if every:
-            figures = [figure for figure in cls.__instances]
+            figures = list(cls.__instances.values())
+            if not figures:
+                warnings.warn(
+                    'save_plots(every=True) found no Scatter instances to save. Only instances which are still'
+                    ' referenced (e.g. assigned to a variable) are saved.'
+                    )
+                return
         else:
             if len(args) == 0:
                 raise TypeError('save_plots() expected at least 1 figure object argument (0 given)')
@@ -629,40 +977,120 @@ class Scatter(object):
                     )
             figures = args
 
-        for figure in figures:
-            if figure.emph_arg:
-                fig = figure.plot(figure.emph_arg, **figure.emph_kwargs)
-            else:
-                fig = Scatter.plot.unemphasized(figure)[0]
-                
+        # instances plotting the defaults hold the memoized xy_pairs result itself, so most are matched by identity.
+        default_xy = Scatter.xy_pairs(Scatter.def_pairs)
+        is_default = [figure.xy is default_xy or figure.xy == default_xy for figure in figures]
+        cwd = Path.cwd()
+
+        # save-file numbers are reserved up front, so figures saved concurrently never share a file name. each save
+        # folder is listed once per call.
+        # name parts of each figure are kept for its details entry and confirmation message.
+        next_ids = {}
+        save_paths = []
+        name_parts = []
+        for figure, default in zip(figures, is_default):
             log_or_not = "Log" if figure.logged else "Simple"
-            is_custom = "Default" if figure.xy == Scatter.xy_pairs(Scatter.def_pairs) else log_or_not
-            len_custom = str(len(figure.xy)) + " " if figure.xy != Scatter.xy_pairs(Scatter.def_pairs) else ""
+            is_custom = "Default" if default else log_or_not
+            len_custom = str(len(figure.xy)) + " " if not default else ""
             is_plural = "s" if len(figure.xy) > 1 else ""
-            emph_detail = figure.emph_arg.replace('_', ' ') + " emphasized -" if figure.emph_arg else ""
+            name_parts.append((log_or_not, is_plural))
+
+            save_folder = Path(cwd, Scatter._FOLDER_NAMES[bool(figure.logged)])
+            prefix = f'{len_custom}{is_custom} Plot{is_plural} - #'
+            # each folder is created if needed and listed the first time a figure is saved to it.
+            if save_folder not in next_ids:
+                save_folder.mkdir(parents=True, exist_ok=True)
+                next_ids[save_folder] = Scatter._next_png_ids(save_folder)
+            png_id = next_ids[save_folder].get(prefix, 1)
+            next_ids[save_folder][prefix] = png_id + 1
+
+            save_paths.append(Path(save_folder, f'{prefix}{png_id:d}.png'))
+
+        # the dataframe and rcParams are sent to worker processes once, when the pool starts, rather than with each job.
+        # `saved` marks each job which completed, so that figures saved before (or, in parallel, alongside) a failed
+        # one are still recorded in the details files before the error propagates.
+        jobs = [(figure, save_path, compress_level, cache) for figure, save_path in zip(figures, save_paths)]
+        saved = []
+        try:
+            if parallel:
+                futures = [
+                    _save_pool(Scatter.DATA, Scatter._rc_params()).submit(_render_and_save, job) for job in jobs
+                    ]
+                saved = [future.exception() is None for future in futures]
+                for future in futures:
+                    future.result()
+            else:
+                for job in jobs:
+                    _render_and_save(job)
+                    saved.append(True)
+        finally:
+            Scatter._record_saves(
+                [
+                    (figure, default, save_path, parts) for figure, default, save_path, parts, done
+                    in zip(figures, is_default, save_paths, name_parts, saved) if done
+                    ]
+                )
 
-            save_folder = Path(Path.cwd(), f'Saved {log_or_not} Plots')
-            if not save_folder.is_dir():
-                Path(save_folder).mkdir(parents=True)
+    @staticmethod
+    def _record_saves(saves: list[tuple]) -> None:
+        """Appends a details entry for each saved figure to the details file of its save folder, and prints a
+        confirmation message for each.
 
-            png_id = 1
-            while Path(f'Saved {log_or_not} Plots/{len_custom}{is_custom} Plot{is_plural} - #{png_id:d}.png').exists():
-                png_id += 1
-            fig.savefig(f'Saved {log_or_not} Plots/{len_custom}{is_custom} Plot{is_plural} - #{png_id:d}.png')
+        Args:
+            saves (list of tuple): (figure, whether it plots the default pairs, save path, (log_or_not, is_plural))
+                for each saved figure.
+        """
+        # details entries are grouped by details file, so that each file is opened once per call, and share one
+        # timestamp. confirmation messages are written to stdout together once every details file is updated.
+        details = {}
+        messages = []
+        created_on = datetime.now().strftime("%d-%m-%Y at %H:%M:%S")
+        for figure, default, save_path, (log_or_not, is_plural) in saves:
+            emph_detail = figure.emph_arg.replace('_', ' ') + " emphasized -" if figure.emph_arg else ""
 
             var_list = "\n".join(str(x) for x in figure.xy)
-            with open(f'Saved {log_or_not} Plots/{log_or_not.upper()}_PLOT_DETAILS.txt', 'a') as save_details:
-                save_details.write(
-                    f'{len_custom}{is_custom} Plot{is_plural} - #{png_id:d} - {emph_detail}'
-                    f'\n{var_list}\n'
-                    f'- Figure Created on {datetime.now().strftime("%d-%m-%Y at %H:%M:%S")}\n'
-                    f'------------------------------------------------------\n'
-                    )
-                
-                print(
-                    f'{is_custom + " " + log_or_not if figure.xy == Scatter.xy_pairs(Scatter.def_pairs) else is_custom}'
-                    f' Plot{is_plural} saved to {save_folder}\n'
-                    )
+            details_path = Path(save_path.parent, f'{log_or_not.upper()}_PLOT_DETAILS.txt')
+            details.setdefault(details_path, []).append(
+                f'{save_path.stem} - {emph_detail}'
+                f'\n{var_list}\n'
+                f'- Figure Created on {created_on}\n'
+                f'------------------------------------------------------\n'
+                )
+
+            messages.append(
+                f'{Scatter._SAVE_LABELS[default, bool(figure.logged)]}'
+                f' Plot{is_plural} saved to {save_path.parent}\n\n'
+                )
+
+        for details_path, entries in details.items():
+            with open(details_path, 'a') as save_details:
+                save_details.write(''.join(entries))
+
+        sys.stdout.write(''.join(messages))
+
+    @staticmethod
+    def _next_png_ids(folder: Path) -> dict[str, int]:
+        """Returns the next unused save-file number for each save-file name prefix in `folder`, where figures are named
+        '(prefix)(number).png' and prefixes end in '#', e.g. 'Default Plots - #'. Found with a single directory
+        listing, rather than checking each candidate file name in turn.
+
+        Args:
+            folder (Path): save folder to be searched.
+
+        Returns:
+            next_ids (dict of str: int): prefix:next save-file number dictionary. Prefixes without saved figures are
+                absent, and start from 1.
+        """
+        pattern = re.compile(r'(.*#)(\d+)\.png')
+        next_ids = {}
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                match = pattern.fullmatch(entry.name)
+                if match:
+                    prefix, png_id = match.group(1), int(match.group(2))
+                    next_ids[prefix] = max(next_ids.get(prefix, 1), png_id + 1)
+
+        return next_ids
 
     @staticmethod    
     def delete_folder(logged=False) -> None:
@@ -671,29 +1099,140 @@ class Scatter(object):
         Args:
             logged (bool): determines deletion of simple plot (False), or log plot save folders (True).
         """ 
-        folder = Path(Path.cwd(), f'Saved {"Log" if logged else "Simple"} Plots')
+        folder_name = Scatter._FOLDER_NAMES[bool(logged)]
+        # the folder is only handed to os functions, so a plain string path is used.
+        folder = os.path.join(os.getcwd(), folder_name)
 
         try:
-            shutil.rmtree(folder)
+            # save folders are flat, so entries are unlinked straight from the directory listing, whose cached file
+            # types avoid the per-entry stat of shutil.rmtree. any nested folders are still removed recursively.
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        shutil.rmtree(entry.path)
+                    else:
+                        os.unlink(entry.path)
+            os.rmdir(folder)
         except FileNotFoundError:
-            print(f"No '{folder.name}' folder exists in the current directory, and so could not be deleted.")
+            print(f"No '{folder_name}' folder exists in the current directory, and so could not be deleted.")
+
+def _save_pool(data: pd.DataFrame, rc_params: dict) -> ProcessPoolExecutor:
+    """Returns the process pool used by `Scatter.save_plots(parallel=True)`. The pool is created on first use and
+    kept for later calls, so worker start-up and module import are paid once per session rather than once per batch.
+    It is replaced when Scatter.DATA or the rcParams change, so that workers always plot the caller's data in the
+    caller's style.
+
+    Args:
+        data (pd.DataFrame): dataframe to plot from, i.e. Scatter.DATA.
+        rc_params (dict): matplotlib rcParams to save figures with. See `Scatter._rc_params()`.
+    """
+    global _SAVE_POOL
+    if _SAVE_POOL is not None:
+        pool, pool_data, pool_rc_params = _SAVE_POOL
+        if pool_data is data and pool_rc_params == rc_params:
+            return pool
+        pool.shutdown()
+
+    pool = ProcessPoolExecutor(initializer=_init_save_worker, initargs=(data, rc_params))
+    _SAVE_POOL = pool, data, rc_params
+
+    return pool
+
+def _init_save_worker(data: pd.DataFrame, rc_params: dict) -> None:
+    """Sets up a worker process of `_save_pool()`. Workers started by spawn re-import the module, so are given the
+    parent's current dataframe and rcParams. Each worker keeps a single dataframe object for all of its jobs, so
+    identity-keyed caches such as the logged data and rank lookup are reused between jobs.
+    """
+    Scatter.DATA = data
+    matplotlib.rcParams.update(rc_params)
+
+def _render_and_save(job) -> None:
+    """Render a Scatter instance, or copy its cached render, and save it as a .png. Defined at module level so that
+    it can be pickled and run in worker processes by `Scatter.save_plots(parallel=True)`.
+
+    Args:
+        job (tuple): (Scatter instance, save path, .png compression level, whether to use the render cache).
+    """
+    figure, save_path, compress_level, cache = job
+    figure._cached_save(save_path, compress_level, cache)
 
 class Regression(Scatter):
-    pass
-#     def plot_regression():
-#             """Plots linear regression line for the volume-against-volume plot."""
-#             plot_variables((('Cerebrum Volume', 'Cerebellum Volume'),))
-#             data_2 = data[['Cerebellum Volume', 'Cerebrum Volume']].copy(deep=False)
+    """Scatter plots with an ordinary least-squares regression line fitted to the data points of each plot.
+    Defaults to the volume-against-volume plot.
+    """
+    def __init__(self, xy=(('Cerebrum Volume', 'Cerebellum Volume'),), colors=None, logged=False, **kwargs):
+        super().__init__(xy, colors, logged, **kwargs)
+
+    @staticmethod
+    def fit_many(x: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Returns the slopes and intercepts of the ordinary least-squares lines of `y` against each row of `x`, from
+        the closed-form solution for a single independent variable. All rows are fitted together with vectorized
+        array operations (row means, deviations, a matrix-vector product and a row-wise sum of squares), rather than
+        one fit per row.
 
-#             data_2.dropna(inplace=True)
+        Args:
+            x (np.ndarray): (M, N) array of M independent variables with N values each, where each row contains at
+                least two distinct values and there are no NaNs.
+            y (np.ndarray): (N,) array of dependent variable values, containing no NaNs.
+
+        Returns:
+            slopes (np.ndarray): (M,) array of the slope of each line.
+            intercepts (np.ndarray): (M,) array of the intercept of each line.
+        """
+        x_means = x.mean(axis=1)
+        x_devs = x - x_means[:, np.newaxis]
+        # deviations of x sum to zero, so x_dev . y equals the usual x_dev . (y - y_mean), without the second temporary.
+        slopes = (x_devs @ y) / np.einsum('ij,ij->i', x_devs, x_devs)
 
-#             predict = 'Cerebellum Volume'
-#             x = np.array(data_2.drop([predict], axis=1))
-#             y = np.array(data_2[predict])
+        return slopes, y.mean() - slopes * x_means
 
-#             model = np.polyfit(x[:, 0], y, 1)
-#             predict = np.poly1d(model)
+    @staticmethod
+    def _ols_fit(x: np.ndarray, y: np.ndarray) -> tuple[float, float]:
+        """Returns the (slope, intercept) of the ordinary least-squares line of `y` against `x`. See
+        `Regression.fit_many()`.
+        """
+        slopes, intercepts = Regression.fit_many(x[np.newaxis], y)
+        return slopes[0], intercepts[0]
 
-#             x_lin_reg = range(0, 1600)
-#             y_lin_reg = predict(x_lin_reg)
-#             plt.plot(x_lin_reg, y_lin_reg, c='k')
+    def _render(self, headless=False, **kwargs):
+        """Plots the instance with its regression lines, so that `display()`, `save()` and `save_plots()` all
+        include them. See `Regression.plot_regression()`.
+        """
+        return self.plot_regression(headless=headless, **kwargs)[0]
+
+    def plot_regression(self, headless=False, **kwargs):
+        """Plots variables (and any emphasis) as with `Scatter.display()`, then plots the linear regression line of
+        each dependent variable against its independent variable. The figure is returned rather than shown; use
+        `display()` or `save()` to output it.
+
+        Args:
+            headless (bool, optional): if True, draw on a standalone Agg-backed figure which is not registered with
+                pyplot, for figures that are only saved. Defaults to False.
+            **kwargs: additional matplotlib.axes.Axes.scatter properties.
+
+        Returns:
+            fig (class): matplotlib.figure.Figure object.
+            axs (array of class): flattened array of the figure's matplotlib.axes.Axes objects.
+        """
+        fig = Scatter._render(self, headless=headless, **kwargs)
+        axs = np.asarray(fig.axes, dtype=object)
+
+        for ax_n, (x, y) in enumerate(self.xy):
+            # points missing either value are excluded with one combined mask, rather than a dropna'd frame copy.
+            x_values = self.data[x].to_numpy(dtype=np.float64)
+            y_values = self.data[y].to_numpy(dtype=np.float64)
+            has_both = ~(np.isnan(x_values) | np.isnan(y_values))
+            x_values, y_values = x_values[has_both], y_values[has_both]
+
+            # a line cannot be fitted to fewer than two distinct x values.
+            if np.unique(x_values).size < 2:
+                continue
+
+            slope, intercept = Regression._ols_fit(x_values, y_values)
+
+            # a straight line needs only its two end points, spanning the fitted data.
+            x_lin_reg = np.array([x_values.min(), x_values.max()])
+            y_lin_reg = slope * x_lin_reg + intercept
+            axs[ax_n].plot(x_lin_reg, y_lin_reg, c='k')
+
+        return fig, axs